@@ -1,19 +1,39 @@
 import builtins
+import importlib
 import logging
 import os
 import shutil
 import signal
 import tempfile
+import threading
 
-from omnigibson.controllers import REGISTERED_CONTROLLERS
-from omnigibson.envs import Environment, VectorEnvironment
 from omnigibson.macros import gm
-from omnigibson.objects import REGISTERED_OBJECTS
-from omnigibson.robots import REGISTERED_ROBOTS
-from omnigibson.scenes import REGISTERED_SCENES
-from omnigibson.sensors import ALL_SENSOR_MODALITIES
-from omnigibson.simulator import _launch_simulator as launch
-from omnigibson.tasks import REGISTERED_TASKS
+
+# Attributes that are lazily imported on first access. Each of these pulls in a large dependency tree
+# (torch, gymnasium, the full object / robot / scene / task registries), so deferring them keeps
+# `import omnigibson` cheap for consumers that only need e.g. the macros or utils
+_LAZY_ATTRS = {
+    "Environment": ("omnigibson.envs", "Environment"),
+    "VectorEnvironment": ("omnigibson.envs", "VectorEnvironment"),
+    "REGISTERED_CONTROLLERS": ("omnigibson.controllers", "REGISTERED_CONTROLLERS"),
+    "REGISTERED_OBJECTS": ("omnigibson.objects", "REGISTERED_OBJECTS"),
+    "REGISTERED_ROBOTS": ("omnigibson.robots", "REGISTERED_ROBOTS"),
+    "REGISTERED_SCENES": ("omnigibson.scenes", "REGISTERED_SCENES"),
+    "REGISTERED_TASKS": ("omnigibson.tasks", "REGISTERED_TASKS"),
+    "ALL_SENSOR_MODALITIES": ("omnigibson.sensors", "ALL_SENSOR_MODALITIES"),
+    "launch": ("omnigibson.simulator", "_launch_simulator"),
+}
+
+
+def __getattr__(name):
+    # PEP 562 module-level getattr -- resolves the attributes in _LAZY_ATTRS on first access and caches
+    # them in the module namespace so subsequent accesses are plain dict lookups
+    if name in _LAZY_ATTRS:
+        module_name, attr_name = _LAZY_ATTRS[name]
+        attr = getattr(importlib.import_module(module_name), attr_name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Create logger
 logging.basicConfig(format="[%(levelname)s] [%(name)s] %(message)s")
@@ -33,7 +53,7 @@ __version__ = "1.1.1"
 root_path = os.path.dirname(os.path.realpath(__file__))
 
 # Store paths to example configs
-example_config_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "configs")
+example_config_path = os.path.join(root_path, "configs")
 
 # Initialize global variables
 app = None  # (this is a singleton so it's okay that it's global)
@@ -79,6 +99,7 @@ def clear(
     global sim
 
     import omnigibson.lazy as lazy
+    from omnigibson.simulator import _launch_simulator as launch
 
     # First save important simulator settings
     init_kwargs = dict(
@@ -140,5 +161,10 @@ def shutdown_handler(*args, **kwargs):
     return signal.default_int_handler(*args, **kwargs)
 
 
-# Something somewhere disables the default SIGINT handler, so we need to re-enable it
-signal.signal(signal.SIGINT, shutdown_handler)
+# Something somewhere disables the default SIGINT handler, so we need to re-enable it.
+# Short-circuit if our handler is already hooked up so that re-imports (e.g.: via importlib.reload) don't
+# re-register, and skip registration entirely off the main thread, where the signal module would raise
+if threading.current_thread() is threading.main_thread():
+    _current_sigint_handler = signal.getsignal(signal.SIGINT)
+    if getattr(_current_sigint_handler, "__name__", None) != shutdown_handler.__name__:
+        signal.signal(signal.SIGINT, shutdown_handler)
@@ -1,13 +1,36 @@
-import inspect
+import sys
 from abc import ABCMeta, abstractmethod
 from enum import IntEnum
 from typing import List
 
-from future.utils import with_metaclass
-
 REGISTERED_PRIMITIVE_SETS = {}
 
 
+def _is_abstract_primitive_set(cls):
+    """
+    Checks whether primitive set class @cls is still an abstract template, i.e.: declares or inherits
+    unimplemented abstract methods.
+
+    This is evaluated during __init_subclass__, before ABCMeta has populated @cls.__abstractmethods__, so we
+    resolve the abstract names inherited from the (already finalized) bases plus any new declarations on @cls
+    itself. Unlike inspect.isabstract, this avoids rescanning the full MRO namespace on every class definition.
+
+    Args:
+        cls (type): Primitive set class to check
+
+    Returns:
+        bool: Whether @cls is abstract
+    """
+    if any(getattr(value, "__isabstractmethod__", False) for value in vars(cls).values()):
+        return True
+    inherited_abstract_names = set()
+    for base in cls.__mro__[1:]:
+        inherited_abstract_names.update(getattr(base, "__abstractmethods__", ()))
+    return any(
+        getattr(getattr(cls, name, None), "__isabstractmethod__", False) for name in inherited_abstract_names
+    )
+
+
 class ActionPrimitiveError(ValueError):
     class Reason(IntEnum):
         # A primitive could not be executed because a precondition was not satisfied, e.g. PLACE was called without an
@@ -29,24 +52,40 @@ class ActionPrimitiveError(ValueError):
 
     def __init__(self, reason: Reason, message, metadata=None):
         self.reason = reason
+        self.message = message
         self.metadata = metadata if metadata is not None else {}
-        super().__init__(f"{reason.name}: {message}. Additional info: {metadata}")
+        self._str_cache = None
+        super().__init__()
+
+    def __str__(self):
+        # Formatting the metadata dict can be expensive, and these errors are frequently raised and caught
+        # (never stringified) by retry loops -- so only build the message when it is actually requested,
+        # and cache it since the same error may be rendered multiple times (e.g.: by error groups)
+        if self._str_cache is None:
+            self._str_cache = f"{self.reason.name}: {self.message}. Additional info: {self.metadata}"
+        return self._str_cache
 
 
 class ActionPrimitiveErrorGroup(ValueError):
     def __init__(self, exceptions: List[ActionPrimitiveError]) -> None:
         self._exceptions = tuple(exceptions)
-        submessages = [f"Attempt {i}: {e}" for i, e in enumerate(exceptions)]
-        submessages = "\n\n".join(submessages)
-        message = "An error occurred during each attempt of this action.\n\n" + submessages
-        super().__init__(message)
+        self._str_cache = None
+        super().__init__()
+
+    def __str__(self):
+        # Stringifying every wrapped error up front is wasted work when the group is caught and handled --
+        # join lazily from a generator on first request and cache the result
+        if self._str_cache is None:
+            submessages = "\n\n".join(f"Attempt {i}: {e}" for i, e in enumerate(self._exceptions))
+            self._str_cache = "An error occurred during each attempt of this action.\n\n" + submessages
+        return self._str_cache
 
     @property
     def exceptions(self):
         return self._exceptions
 
 
-class BaseActionPrimitiveSet(with_metaclass(ABCMeta, object)):
+class BaseActionPrimitiveSet(metaclass=ABCMeta):
     def __init_subclass__(cls, **kwargs):
         """
         Registers all subclasses as part of this registry. This is useful to decouple internal codebase from external
@@ -55,8 +94,9 @@ class BaseActionPrimitiveSet(with_metaclass(ABCMeta, object)):
         directly in string-from in e.g., their config files, without having to manually set the str-to-class mapping
         in our code.
         """
-        if not inspect.isabstract(cls):
-            REGISTERED_PRIMITIVE_SETS[cls.__name__] = cls
+        if not _is_abstract_primitive_set(cls):
+            # Intern the key so config-driven string lookups hit the fast pointer-comparison path
+            REGISTERED_PRIMITIVE_SETS[sys.intern(cls.__name__)] = cls
 
     def __init__(self, env):
         self.env = env
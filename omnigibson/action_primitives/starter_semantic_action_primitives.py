@@ -1814,12 +1814,14 @@ class StarterSemanticActionPrimitives(BaseActionPrimitiveSet):
                 distance_lo, distance_hi = 0.0, 5.0
                 distance = (th.rand(1) * (distance_hi - distance_lo) + distance_lo).item()
                 yaw_lo, yaw_hi = -math.pi, math.pi
-                yaw = th.rand(1) * (yaw_hi - yaw_lo) + yaw_lo
-                avg_arm_workspace_range = th.mean(self.robot.arm_workspace_range[self.arm])
-                pose_2d = th.cat(
+                yaw = (th.rand(1) * (yaw_hi - yaw_lo) + yaw_lo).item()
+                avg_arm_workspace_range = th.mean(self.robot.arm_workspace_range[self.arm]).item()
+                # These are all scalars, so plain math trig avoids dispatching through tensor ops in
+                # this (potentially many-attempt) sampling loop
+                pose_2d = th.tensor(
                     [
-                        pose_on_obj[0][0] + distance * th.cos(yaw),
-                        pose_on_obj[0][1] + distance * th.sin(yaw),
+                        pose_on_obj[0][0].item() + distance * math.cos(yaw),
+                        pose_on_obj[0][1].item() + distance * math.sin(yaw),
                         yaw + math.pi - avg_arm_workspace_range,
                     ]
                 )
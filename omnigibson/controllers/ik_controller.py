@@ -3,7 +3,7 @@ import math
 import torch as th
 
 import omnigibson.utils.transform_utils as T
-from omnigibson.controllers import ControlType, ManipulationController
+from omnigibson.controllers import ManipulationController
 from omnigibson.controllers.joint_controller import JointController
 from omnigibson.macros import create_module_macros, gm
 from omnigibson.utils.control_utils import orientation_error
@@ -331,10 +331,11 @@ class InverseKinematicsController(JointController, ManipulationController):
             delta_j = j_eef_pinv @ err
             target_joint_pos = current_joint_pos + delta_j
 
-            # Clip values to be within the joint limits
+            # Clip values to be within the joint limits -- since this controller always runs with
+            # motor_type="position", the cached per-DOF motor limits are exactly the joint position limits
             target_joint_pos = target_joint_pos.clamp(
-                min=self._control_limits[ControlType.get_type("position")][0][self.dof_idx],
-                max=self._control_limits[ControlType.get_type("position")][1][self.dof_idx],
+                min=self._motor_lower_limits,
+                max=self._motor_upper_limits,
             )
 
         # Optionally pass through smoothing filter for better stability
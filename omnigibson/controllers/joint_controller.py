@@ -124,6 +124,14 @@ class JointController(LocomotionController, ManipulationController, GripperContr
             self._use_delta_commands and type(command_output_limits) == str and command_output_limits == "default"
         ), "Cannot use 'default' command output limits in delta commands mode of JointController. Try None instead."
 
+        # Resolve the motor control type before running super init, since the super init reads
+        # self.control_type when standardizing default command output limits
+        self._motor_control_type = ControlType.get_type(type_str=self._motor_type)
+        self._control_type = ControlType.EFFORT if self._use_impedances else self._motor_control_type
+        self._joint_state_key = f"joint_{self._motor_type}"
+        # Also resolved pre-super: the super init queries command_dim while standardizing command limits
+        self._command_dim = len(dof_idx)
+
         # Run super init
         super().__init__(
             control_freq=control_freq,
@@ -133,9 +141,16 @@ class JointController(LocomotionController, ManipulationController, GripperContr
             command_output_limits=command_output_limits,
         )
 
+        # Gather this controller's per-DOF motor limits once -- these are needed on every goal update, and
+        # re-running the fancy-indexed gather there is wasted work since the limits and dof_idx are both
+        # fixed at construction time
+        motor_limits = self._control_limits[self._motor_control_type]
+        self._motor_lower_limits = motor_limits[0][self.dof_idx]
+        self._motor_upper_limits = motor_limits[1][self.dof_idx]
+
     def _update_goal(self, command, control_dict):
         # Compute the base value for the command
-        base_value = control_dict[f"joint_{self._motor_type}"][self.dof_idx]
+        base_value = control_dict[self._joint_state_key][self.dof_idx]
 
         # If we're using delta commands, add this value
         if self._use_delta_commands:
@@ -165,10 +180,7 @@ class JointController(LocomotionController, ManipulationController, GripperContr
             target = command
 
         # Clip the command based on the limits
-        target = target.clip(
-            self._control_limits[ControlType.get_type(self._motor_type)][0][self.dof_idx],
-            self._control_limits[ControlType.get_type(self._motor_type)][1][self.dof_idx],
-        )
+        target = target.clip(self._motor_lower_limits, self._motor_upper_limits)
 
         return dict(target=target)
 
@@ -189,7 +201,7 @@ class JointController(LocomotionController, ManipulationController, GripperContr
         Returns:
             Array[float]: outputted (non-clipped!) control signal to deploy
         """
-        base_value = control_dict[f"joint_{self._motor_type}"][self.dof_idx]
+        base_value = control_dict[self._joint_state_key][self.dof_idx]
         target = goal_dict["target"]
 
         # Convert control into efforts
@@ -197,7 +209,7 @@ class JointController(LocomotionController, ManipulationController, GripperContr
             if self._motor_type == "position":
                 # Run impedance controller -- effort = pos_err * kp + vel_err * kd
                 position_error = target - base_value
-                vel_pos_error = -control_dict[f"joint_velocity"][self.dof_idx]
+                vel_pos_error = -control_dict["joint_velocity"][self.dof_idx]
                 u = position_error * self.kp + vel_pos_error * self.kd
             elif self._motor_type == "velocity":
                 # Compute command torques via PI velocity controller plus gravity compensation torques
@@ -229,7 +241,7 @@ class JointController(LocomotionController, ManipulationController, GripperContr
         # Compute based on mode
         if self._motor_type == "position":
             # Maintain current qpos
-            target = control_dict[f"joint_{self._motor_type}"][self.dof_idx]
+            target = control_dict[self._joint_state_key][self.dof_idx]
         else:
             # For velocity / effort, directly set to 0
             target = th.zeros(self.control_dim)
@@ -241,10 +253,10 @@ class JointController(LocomotionController, ManipulationController, GripperContr
             if self._use_delta_commands:
                 return th.zeros(self.command_dim)
             else:
-                return control_dict[f"joint_position"][self.dof_idx]
+                return control_dict["joint_position"][self.dof_idx]
         elif self.motor_type == "velocity":
             if self._use_delta_commands:
-                return -control_dict[f"joint_velocity"][self.dof_idx]
+                return -control_dict["joint_velocity"][self.dof_idx]
             else:
                 return th.zeros(self.command_dim)
 
@@ -275,8 +287,8 @@ class JointController(LocomotionController, ManipulationController, GripperContr
 
     @property
     def control_type(self):
-        return ControlType.EFFORT if self._use_impedances else ControlType.get_type(type_str=self._motor_type)
+        return self._control_type
 
     @property
     def command_dim(self):
-        return len(self.dof_idx)
+        return self._command_dim
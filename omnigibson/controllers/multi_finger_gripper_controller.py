@@ -5,11 +5,13 @@ from omnigibson.controllers import ControlType, GripperController, IsGraspingSta
 from omnigibson.macros import create_module_macros
 from omnigibson.utils.python_utils import assert_valid_key
 
-VALID_MODES = {
-    "binary",
-    "smooth",
-    "independent",
-}
+VALID_MODES = frozenset(
+    {
+        "binary",
+        "smooth",
+        "independent",
+    }
+)
 
 
 # Create settings for this module
@@ -91,15 +93,29 @@ class MultiFingerGripperController(GripperController):
         # Store arguments
         assert_valid_key(key=motor_type.lower(), valid_keys=ControlType.VALID_TYPES_STR, name="motor_type")
         self._motor_type = motor_type.lower()
+        # Cache the corresponding control type -- ControlType.get_type re-validates and re-hashes the string,
+        # and this value is needed on every control step
+        self._motor_control_type = ControlType.get_type(type_str=self._motor_type)
         assert_valid_key(key=mode, valid_keys=VALID_MODES, name="mode for multi finger gripper")
         self._inverted = inverted
         self._mode = mode
+        # Resolve the mode branches taken inside the per-step methods once, so the hot paths test a plain
+        # bool instead of re-comparing the mode string every call
+        self._is_binary = mode == "binary"
+        self._is_independent = mode == "independent"
+        # The command dimension is queried on every command preprocess / no-op goal computation -- and by
+        # the super init while standardizing command limits -- so resolve it up front from the mode
+        self._command_dim = len(dof_idx) if self._is_independent else 1
         self._limit_tolerance = limit_tolerance
         self._open_qpos = open_qpos if open_qpos is None else th.tensor(open_qpos)
         self._closed_qpos = closed_qpos if closed_qpos is None else th.tensor(closed_qpos)
 
         # Create other args to be filled in at runtime
         self._is_grasping = IsGraspingState.FALSE
+        # Snapshot of the (finger_pos, finger_vel) state from the latest control step, consumed lazily by
+        # is_grasping() -- see compute_control
+        self._grasp_state_data = None
+        self._grasp_state_dirty = False
 
         # If we're using binary signal, we override the command output limits
         if mode == "binary":
@@ -114,21 +130,47 @@ class MultiFingerGripperController(GripperController):
             command_output_limits=command_output_limits,
         )
 
+        # Precompute the per-DOF tensors consumed by compute_control's inner math -- the control limits and
+        # dof_idx are fixed at construction time, so gathering them on every control step is wasted work
+        self._open_target = (
+            self._control_limits[self._motor_control_type][1][self.dof_idx]
+            if self._open_qpos is None
+            else self._open_qpos
+        )
+        self._closed_target = (
+            self._control_limits[self._motor_control_type][0][self.dof_idx]
+            if self._closed_qpos is None
+            else self._closed_qpos
+        )
+        pos_limits = self._control_limits[ControlType.POSITION]
+        self._pos_min = pos_limits[0][self.dof_idx]
+        self._pos_max = pos_limits[1][self.dof_idx]
+        self._pos_upper_bounds = self._pos_max - self._limit_tolerance
+        self._pos_lower_bounds = self._pos_min + self._limit_tolerance
+        # Mean limit positions consumed by the grasping-state heuristics -- since the limits are fixed,
+        # the per-joint limit-distance means reduce to comparisons against these scalars
+        self._pos_min_mean = self._pos_min.mean()
+        self._pos_max_mean = self._pos_max.mean()
+
     def reset(self):
         # Call super first
         super().reset()
 
         # reset grasping state
         self._is_grasping = IsGraspingState.FALSE
+        self._grasp_state_data = None
+        self._grasp_state_dirty = False
 
     def _preprocess_command(self, command):
         # We extend this method to make sure command is always n-dimensional
-        if self._mode != "independent":
-            command = (
-                th.tensor([command] * self.command_dim)
-                if type(command) in {int, float}
-                else th.tensor([command[0]] * self.command_dim)
-            )
+        if not self._is_independent:
+            # command_dim is 1 for non-independent modes, so only wrap scalars / trim over-long inputs --
+            # commands that already arrive as 1-element tensors (the common case) pass through untouched
+            # rather than being rebuilt element-by-element every step
+            if not isinstance(command, th.Tensor):
+                command = th.tensor([command], dtype=th.float32)
+            elif command.numel() != 1:
+                command = command.reshape(-1)[:1]
 
         # Flip the command if the direction is inverted.
         if self._inverted:
@@ -161,57 +203,53 @@ class MultiFingerGripperController(GripperController):
         target = goal_dict["target"]
         joint_pos = control_dict["joint_position"][self.dof_idx]
         # Choose what to do based on control mode
-        if self._mode == "binary":
-            # Use max control signal
+        if self._is_binary:
+            # Use max control signal. Clone the cached target: the base class's clip_control writes into
+            # the returned control in place, which would otherwise permanently clamp the cached tensor the
+            # first time a user-specified open/closed qpos falls outside the control limits
             should_open = target[0] >= 0.0 if not self._inverted else target[0] > 0.0
-            if should_open:
-                u = (
-                    self._control_limits[ControlType.get_type(self._motor_type)][1][self.dof_idx]
-                    if self._open_qpos is None
-                    else self._open_qpos
-                )
-            else:
-                u = (
-                    self._control_limits[ControlType.get_type(self._motor_type)][0][self.dof_idx]
-                    if self._closed_qpos is None
-                    else self._closed_qpos
-                )
+            u = (self._open_target if should_open else self._closed_target).clone()
+        elif self._is_independent:
+            # Per-joint continuous signal -- already at control dim
+            u = target
         else:
-            # Use continuous signal. Make sure to go from command to control dim.
-            u = th.full((self.control_dim,), target[0]) if len(target) == 1 else target
+            # Smooth mode: broadcast the single command across all joints. repeat() materializes an owned
+            # tensor -- clip_control writes into the returned control in place, which a stride-0 expanded
+            # view would reject
+            u = target.repeat(self.control_dim)
 
         # If we're near the joint limits and we're using velocity / torque control, we zero out the action
         if self._motor_type in {"velocity", "torque"}:
-            violate_upper_limit = (
-                joint_pos > self._control_limits[ControlType.POSITION][1][self.dof_idx] - self._limit_tolerance
-            )
-            violate_lower_limit = (
-                joint_pos < self._control_limits[ControlType.POSITION][0][self.dof_idx] + self._limit_tolerance
+            # Branchless zeroing: fold both limit checks into a single boolean mask and select in one pass.
+            # Note: must stay out-of-place, since in independent mode @u aliases the stored goal target
+            violation = ((joint_pos > self._pos_upper_bounds) & (u > 0)) | (
+                (joint_pos < self._pos_lower_bounds) & (u < 0)
             )
-            violation = th.logical_or(violate_upper_limit * (u > 0), violate_lower_limit * (u < 0))
-            u *= ~violation
+            # Violations are rare in steady state, so only pay for the select when one actually occurred
+            if violation.any():
+                u = th.where(violation, 0.0, u)
 
-        # Update whether we're grasping or not
-        self._update_grasping_state(control_dict=control_dict)
+        # Defer the grasping-state heuristics until somebody actually asks via is_grasping() -- snapshot
+        # the two joint slices they need (both already copies, since fancy indexing copies), because the
+        # control dict contents may be refreshed before the query happens
+        self._grasp_state_data = (joint_pos, control_dict["joint_velocity"][self.dof_idx])
+        self._grasp_state_dirty = True
 
         # Return control
         return u
 
-    def _update_grasping_state(self, control_dict):
+    def _update_grasping_state(self, finger_pos, finger_vel):
         """
         Updates internal inferred grasping state of the gripper being controlled by this gripper controller
 
         Args:
-            control_dict (dict): dictionary that should include any relevant keyword-mapped
-                states necessary for controller computation. Must include the following keys:
-
-                    joint_position: Array of current joint positions
-                    joint_velocity: Array of current joint velocities
+            finger_pos (Array[float]): Finger joint positions snapshotted at the latest control step
+            finger_vel (Array[float]): Finger joint velocities snapshotted at the latest control step
         """
         # Calculate grasping state based on mode of this controller
 
         # Independent mode of MultiFingerGripperController does not have any good heuristics to determine is_grasping
-        if self._mode == "independent":
+        if self._is_independent:
             is_grasping = IsGraspingState.UNKNOWN
 
         # No control has been issued before -- we assume not grasping
@@ -228,8 +266,6 @@ class MultiFingerGripperController(GripperController):
             is_grasping = IsGraspingState.UNKNOWN
 
         else:
-            finger_pos = control_dict["joint_position"][self.dof_idx]
-
             # For joint position control, if the desired positions are the same as the current positions, is_grasping unknown
             if self._motor_type == "position" and th.mean(th.abs(finger_pos - self._control)) < m.POS_TOLERANCE:
                 is_grasping = IsGraspingState.UNKNOWN
@@ -240,25 +276,22 @@ class MultiFingerGripperController(GripperController):
 
             # Otherwise, the last control signal intends to "move" the gripper
             else:
-                finger_vel = control_dict["joint_velocity"][self.dof_idx]
-                min_pos = self._control_limits[ControlType.POSITION][0][self.dof_idx]
-                max_pos = self._control_limits[ControlType.POSITION][1][self.dof_idx]
-
                 # Make sure we don't have any invalid values (i.e.: fingers should be within the limits)
-                finger_pos = th.clip(finger_pos, min_pos, max_pos)
-
-                # Check distance from both ends of the joint limits
-                dist_from_lower_limit = finger_pos - min_pos
-                dist_from_upper_limit = max_pos - finger_pos
+                finger_pos = th.clip(finger_pos, self._pos_min, self._pos_max)
 
-                # If the joint positions are not near the joint limits with some tolerance (m.POS_TOLERANCE)
+                # If the joint positions are not near the joint limits with some tolerance (m.POS_TOLERANCE).
+                # The limits are fixed, so the mean distances from both limit ends reduce to comparing the
+                # mean finger position against the precomputed mean limits -- one reduction instead of
+                # materializing two per-joint distance tensors and reducing each
+                mean_finger_pos = th.mean(finger_pos)
                 valid_grasp_pos = (
-                    th.mean(dist_from_lower_limit) > m.POS_TOLERANCE
-                    and th.mean(dist_from_upper_limit) > m.POS_TOLERANCE
+                    mean_finger_pos - self._pos_min_mean > m.POS_TOLERANCE
+                    and self._pos_max_mean - mean_finger_pos > m.POS_TOLERANCE
                 )
 
-                # And the joint velocities are close to zero with some tolerance (m.VEL_TOLERANCE)
-                valid_grasp_vel = th.all(th.abs(finger_vel) < m.VEL_TOLERANCE)
+                # And the joint velocities are close to zero with some tolerance (m.VEL_TOLERANCE) -- only
+                # checked if the position check passed
+                valid_grasp_vel = valid_grasp_pos and th.all(th.abs(finger_vel) < m.VEL_TOLERANCE)
 
                 # Then the gripper is grasping something, which stops the gripper from reaching its desired state
                 is_grasping = IsGraspingState.TRUE if valid_grasp_pos and valid_grasp_vel else IsGraspingState.FALSE
@@ -272,14 +305,14 @@ class MultiFingerGripperController(GripperController):
 
     def _compute_no_op_action(self, control_dict):
         # Take care of the special case of binary control
-        if self._mode == "binary":
+        if self._is_binary:
             command_val = -1 if self.is_grasping() == IsGraspingState.TRUE else 1
             if self._inverted:
                 command_val = -1 * command_val
             return th.tensor([command_val], dtype=th.float32)
 
         if self._motor_type == "position":
-            command = control_dict[f"joint_position"][self.dof_idx]
+            command = control_dict["joint_position"][self.dof_idx]
         elif self._motor_type == "velocity":
             command = th.zeros(self.command_dim)
         else:
@@ -295,13 +328,18 @@ class MultiFingerGripperController(GripperController):
         return dict(target=(self.command_dim,))
 
     def is_grasping(self):
-        # Return cached value
+        # Lazily evaluate the heuristics: compute_control only snapshots the joint state it saw, so the
+        # reductions run at most once per query rather than once per control step -- the grasping state is
+        # typically read at most once per env step while the controller often steps more frequently
+        if self._grasp_state_dirty:
+            self._update_grasping_state(*self._grasp_state_data)
+            self._grasp_state_dirty = False
         return self._is_grasping
 
     @property
     def control_type(self):
-        return ControlType.get_type(type_str=self._motor_type)
+        return self._motor_control_type
 
     @property
     def command_dim(self):
-        return len(self.dof_idx) if self._mode == "independent" else 1
+        return self._command_dim
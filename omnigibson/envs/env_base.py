@@ -1,6 +1,5 @@
 import random
 import string
-from collections import OrderedDict
 from collections.abc import Iterable
 from copy import deepcopy
 
@@ -618,7 +617,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
                 - dict: info, i.e. dictionary with any useful information
         """
         # Pre-processing before stepping simulation
-        if isinstance(action, Iterable) and not isinstance(action, (dict, OrderedDict)):
+        if isinstance(action, Iterable) and not isinstance(action, dict):
             # Convert numpy arrays and lists to tensors
             # Skip dict action
             action = th.as_tensor(action, dtype=th.float).flatten()
@@ -41,17 +41,19 @@ macros = MacroDict()
 gm = macros.globals
 
 
+# Resolve the module directory once at import -- realpath hits the filesystem, so we avoid repeating it for
+# every path determined below
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
 def determine_gm_path(default_path, env_var_name):
-    # Start with the default path
-    path = default_path
-    # Override with the environment variable, if set
-    if env_var_name in os.environ:
-        path = os.environ[env_var_name]
+    # Start with the default path, overridden by the environment variable if set
+    path = os.environ.get(env_var_name, default_path)
     # Expand the user directory (~)
     path = os.path.expanduser(path)
     # Make the path absolute if it's not already
     if not os.path.isabs(path):
-        path = os.path.join(os.path.dirname(os.path.realpath(__file__)), path)
+        path = os.path.join(_MODULE_DIR, path)
     return path
 
 
@@ -92,6 +92,7 @@ class ControllableObject(BaseObject):
         self._controllers = None
         self.dof_names_ordered = None
         self._control_enabled = True
+        self._default_u_type_vec = None  # Preallocated template of per-DOF NONE control types
 
         class_name = self.__class__.__name__.lower()
         if relative_prim_path:
@@ -433,8 +434,11 @@ class ControllableObject(BaseObject):
 
         # Compose controls
         u_vec = th.zeros(self.n_dof)
-        # By default, the control type is None and the control value is 0 (th.zeros) - i.e. no control applied
-        u_type_vec = th.tensor([ControlType.NONE] * self.n_dof)
+        # By default, the control type is None and the control value is 0 (th.zeros) - i.e. no control applied.
+        # Clone a preallocated template rather than building a fresh n-DOF Python list of enum members per step
+        if self._default_u_type_vec is None:
+            self._default_u_type_vec = th.full((self.n_dof,), ControlType.NONE, dtype=th.long)
+        u_type_vec = self._default_u_type_vec.clone()
         for group, ctrl in control.items():
             idx = self._controllers[group].dof_idx
             u_vec[idx] = ctrl["value"]
@@ -499,6 +503,37 @@ class ControllableObject(BaseObject):
         # Set indices manually so that we're standardized
         indices = range(self.n_dof)
 
+        # Fast path: when every joint owns exactly one DOF (i.e.: no spherical joints, which holds for the
+        # overwhelmingly common case), the per-DOF grouping below reduces to boolean masking, so we can skip the
+        # Python-level while loop entirely and dispatch with vectorized gathers
+        if self.n_joints == self.n_dof:
+            pos_idxs = th.nonzero(control_type == ControlType.POSITION, as_tuple=True)[0]
+            vel_idxs = th.nonzero(control_type == ControlType.VELOCITY, as_tuple=True)[0]
+            # NONE-typed DOFs are deployed as zero efforts
+            none_mask = control_type == ControlType.NONE
+            eff_idxs = th.nonzero((control_type == ControlType.EFFORT) | none_mask, as_tuple=True)[0]
+            if len(pos_idxs) + len(vel_idxs) + len(eff_idxs) != self.n_dof:
+                invalid_types = control_type[
+                    ~((control_type == ControlType.POSITION) | (control_type == ControlType.VELOCITY))
+                    & ~((control_type == ControlType.EFFORT) | none_mask)
+                ]
+                raise ValueError("Invalid control type specified: {}".format(invalid_types[0].item()))
+            if len(pos_idxs) > 0:
+                ControllableObjectViewAPI.set_joint_position_targets(
+                    self.articulation_root_path, positions=control[pos_idxs].to(th.float), indices=pos_idxs
+                )
+            if len(vel_idxs) > 0:
+                ControllableObjectViewAPI.set_joint_velocity_targets(
+                    self.articulation_root_path, velocities=control[vel_idxs].to(th.float), indices=vel_idxs
+                )
+            if len(eff_idxs) > 0:
+                efforts = control[eff_idxs].to(th.float)
+                efforts[none_mask[eff_idxs]] = 0.0
+                ControllableObjectViewAPI.set_joint_efforts(
+                    self.articulation_root_path, efforts=efforts, indices=eff_idxs
+                )
+            return
+
         # Standardize normalized input
         n_indices = len(indices)
 
@@ -86,6 +86,7 @@ class BaseObject(EntityPrim, Registerable, metaclass=ABCMeta):
         # Values to be created at runtime
         self._highlight_cached_values = None
         self._highlighted = None
+        self._mass_cache = None
 
         # Create load config from inputs
         load_config = dict() if load_config is None else load_config
@@ -121,7 +122,9 @@ class BaseObject(EntityPrim, Registerable, metaclass=ABCMeta):
 
     def load(self, scene):
         prim = super().load(scene)
-        log.info(f"Loaded {self.name} at {self.prim_path}")
+        # Use lazy %-formatting so we don't pay for string construction when INFO logging is disabled --
+        # this runs once per object and adds up when loading scenes with hundreds of objects
+        log.info("Loaded %s at %s", self.name, self.prim_path)
         return prim
 
     def remove(self):
@@ -129,7 +132,7 @@ class BaseObject(EntityPrim, Registerable, metaclass=ABCMeta):
         super().remove()
 
         # Notify user that the object was removed
-        log.info(f"Removed {self.name} from {self.prim_path}")
+        log.info("Removed %s from %s", self.name, self.prim_path)
 
     def _post_load(self):
         # Add fixed joint or make object kinematic only if we're fixing the base
@@ -157,19 +160,24 @@ class BaseObject(EntityPrim, Registerable, metaclass=ABCMeta):
         # Actually apply the kinematic-only decision
         self._load_config["kinematic_only"] = kinematic_only
 
+        # Invalidate the cached cumulative mass since the set of owned links may change during loading
+        self._mass_cache = None
+
         # Run super first
         super()._post_load()
 
         # If the object is fixed_base but kinematic only is false, create the joint
         if self.fixed_base and not self.kinematic_only:
+            # Compute the prim path once -- each access re-resolves the scene-relative path
+            prim_path = self.prim_path
             # Create fixed joint, and set Body0 to be this object's root prim
             # This renders, which causes a material lookup error since we're creating a temp file, so we suppress
             # the error explicitly here
             with suppress_omni_log(channels=["omni.hydra"]):
                 create_joint(
-                    prim_path=f"{self.prim_path}/rootJoint",
+                    prim_path=f"{prim_path}/rootJoint",
                     joint_type="FixedJoint",
-                    body1=f"{self.prim_path}/{self._root_link_name}",
+                    body1=f"{prim_path}/{self._root_link_name}",
                 )
 
             # Delete n_fixed_joints cached property if it exists since the number of fixed joints has now changed
@@ -274,13 +282,14 @@ class BaseObject(EntityPrim, Registerable, metaclass=ABCMeta):
     def mass(self):
         """
         Returns:
-             float: Cumulative mass of this potentially articulated object.
+             float: Cumulative mass of this potentially articulated object. This value is cached after the first
+                access since each per-link mass query crosses into the physics backend; the cache is invalidated
+                whenever this object's set of links may change (i.e.: during loading)
         """
-        mass = 0.0
-        for link in self._links.values():
-            mass += link.mass
+        if self._mass_cache is None:
+            self._mass_cache = sum(link.mass for link in self._links.values())
 
-        return mass
+        return self._mass_cache
 
     @mass.setter
     def mass(self, mass):
@@ -333,21 +342,29 @@ class BaseObject(EntityPrim, Registerable, metaclass=ABCMeta):
         if enabled == self._highlighted:
             return
 
-        for material in self.materials:
-            if enabled:
-                # Store values before swapping
+        if enabled:
+            # Store values before swapping
+            for material in self.materials:
                 self._highlight_cached_values[material] = {
                     "enable_emission": material.enable_emission,
                     "emissive_color": material.emissive_color,
                     "emissive_intensity": material.emissive_intensity,
                 }
-            material.enable_emission = True if enabled else self._highlight_cached_values[material]["enable_emission"]
-            material.emissive_color = (
-                m.HIGHLIGHT_RGB if enabled else self._highlight_cached_values[material]["emissive_color"].tolist()
-            )
-            material.emissive_intensity = (
-                m.HIGHLIGHT_INTENSITY if enabled else self._highlight_cached_values[material]["emissive_intensity"]
-            )
+
+        # Batch all shader writes into a single USD change block so the renderer processes one notification
+        # batch rather than three per material. All reads happen above, so nothing composed is queried while
+        # change processing is deferred
+        with lazy.pxr.Sdf.ChangeBlock():
+            for material in self.materials:
+                material.enable_emission = (
+                    True if enabled else self._highlight_cached_values[material]["enable_emission"]
+                )
+                material.emissive_color = (
+                    m.HIGHLIGHT_RGB if enabled else self._highlight_cached_values[material]["emissive_color"].tolist()
+                )
+                material.emissive_intensity = (
+                    m.HIGHLIGHT_INTENSITY if enabled else self._highlight_cached_values[material]["emissive_intensity"]
+                )
 
         # Update internal value
         self._highlighted = enabled
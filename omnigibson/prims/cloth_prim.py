@@ -452,6 +452,28 @@ class ClothPrim(GeomPrim):
         """
         return
 
+    def set_velocities(self, linear_velocity, angular_velocity):
+        """
+        Sets both velocities of this cloth prim. Cloth velocities live in the particle velocities rather
+        than a rigid body view, so this simply routes through the per-component setters.
+
+        Args:
+            linear_velocity (th.tensor): linear velocity to set all the particles of the cloth prim to. Shape (3,).
+            angular_velocity (th.tensor): angular velocity -- ignored, because a cloth prim doesn't have one.
+        """
+        self.set_linear_velocity(linear_velocity)
+        self.set_angular_velocity(angular_velocity)
+
+    def get_velocities(self):
+        """
+        Returns:
+            2-tuple:
+                - th.tensor: current average linear velocity of the particles of the cloth prim. Shape (3,).
+                - th.tensor: zero vector as a placeholder because a cloth prim doesn't have an angular
+                    velocity. Shape (3,).
+        """
+        return self.get_linear_velocity(), self.get_angular_velocity()
+
     def wake(self):
         # TODO (eric): Just a pass through for now.
         return
@@ -58,6 +58,7 @@ class EntityPrim(XFormPrim):
         self._articulated = None
         self._articulation_tree = None
         self._articulation_view_direct = None
+        self._aabb_cache = (None, -1, -1)  # (value, pose write generation, time step stamp)
 
         # This needs to be initialized to be used for _load() of PrimitiveObject
         self._prim_type = (
@@ -994,6 +995,27 @@ class EntityPrim(XFormPrim):
         """
         return self.root_link.get_angular_velocity()
 
+    def set_velocities(self, linear_velocity, angular_velocity):
+        """
+        Sets both the linear and angular velocities of the root prim in stage with a single physics-view write.
+
+        Args:
+            linear_velocity (th.tensor): linear velocity to set the rigid prim to, in the world frame. Shape (3,).
+            angular_velocity (th.tensor): angular velocity to set the rigid prim to, in the world frame. Shape (3,).
+        """
+        self.root_link.set_velocities(linear_velocity, angular_velocity)
+
+    def get_velocities(self):
+        """
+        Grabs both the linear and angular velocities of the root prim in stage with a single physics-view read
+
+        Returns:
+            2-tuple:
+                - th.tensor: linear velocity of the root prim, in the world frame. Shape (3,).
+                - th.tensor: angular velocity of the root prim, in the world frame. Shape (3,).
+        """
+        return self.root_link.get_velocities()
+
     def get_relative_linear_velocity(self):
         """
         Returns:
@@ -1409,6 +1431,20 @@ class EntityPrim(XFormPrim):
 
     @property
     def aabb(self):
+        # Computing the AABB aggregates boundary points across all owned links, so multiple consumers querying it
+        # within a single physics step (e.g.: task rewards, planning) would repeat identical work. We therefore cache
+        # the result against the simulator's time step index, additionally requiring that no pose was directly set
+        # since the cached value was computed. The latter is tracked via PoseAPI's write generation -- not its VALID
+        # flag, which any pose read flips back to True and therefore cannot tell a teleport apart from a refresh
+        aabb, generation, stamp = self._aabb_cache
+        if (
+            aabb is not None
+            and og.sim is not None
+            and generation == PoseAPI.WRITE_GENERATION
+            and stamp == og.sim.current_time_step_index
+        ):
+            return aabb
+
         # If we're a cloth prim type, we compute the bounding box from the limits of the particles. Otherwise, use the
         # normal method for computing bounding box
         if self._prim_type == PrimType.CLOTH:
@@ -1423,6 +1459,11 @@ class EntityPrim(XFormPrim):
             all_points = th.cat([p for p in points_world if p is not None], dim=0)
             aabb_lo = th.min(all_points, dim=0).values
             aabb_hi = th.max(all_points, dim=0).values
+
+        # Update the cache, stamped with the pose write generation the boundary points above were read under
+        if og.sim is not None:
+            self._aabb_cache = ((aabb_lo, aabb_hi), PoseAPI.WRITE_GENERATION, og.sim.current_time_step_index)
+
         return aabb_lo, aabb_hi
 
     @property
@@ -1537,8 +1578,7 @@ class EntityPrim(XFormPrim):
         """
         Zero out all velocities for this prim
         """
-        self.set_linear_velocity(velocity=th.zeros(3))
-        self.set_angular_velocity(velocity=th.zeros(3))
+        self.set_velocities(linear_velocity=th.zeros(3), angular_velocity=th.zeros(3))
         for joint in self._joints.values():
             joint.keep_still()
         # Make sure object is awake
@@ -1624,8 +1664,29 @@ class EntityPrim(XFormPrim):
 
         # TODO: Remove this backwards-compatible part once we re-sample scenes
         if "joints" in state:
-            for joint_name, joint_state in state["joints"].items():
-                self._joints[joint_name]._load_state(state=joint_state)
+            if self.n_joints > 0:
+                # Gather the per-joint states in DOF order and write each quantity with a single batched call,
+                # rather than issuing multiple physics-view writes per joint. Two subtleties preserved from the
+                # old per-joint loop: joints missing from the saved dict keep their current position / velocity
+                # (the loop only touched saved joints), and efforts are only restored for driven joints --
+                # JointPrim._load_state does the same, since for passive joints the dumped (measured) effort
+                # would be injected as an actuation force. Note that joint targets are deliberately not
+                # restored, consistent with the current format (see _dump_state for details)
+                pos, vel, effort = [], [], []
+                for joint_name, joint in self._joints.items():
+                    joint_state = state["joints"].get(joint_name, None)
+                    if joint_state is None:
+                        cur_pos, cur_vel, _ = joint.get_state()
+                        pos.append(cur_pos)
+                        vel.append(cur_vel)
+                        effort.append(th.zeros(joint.n_dof))
+                    else:
+                        pos.append(joint_state["pos"])
+                        vel.append(joint_state["vel"])
+                        effort.append(joint_state["effort"] if joint.driven else th.zeros(joint.n_dof))
+                self.set_joint_positions(th.cat(pos))
+                self.set_joint_velocities(th.cat(vel))
+                self.set_joint_efforts(th.cat(effort))
 
         elif self.n_joints > 0:
             self.set_joint_positions(state["joint_pos"])
@@ -315,6 +315,31 @@ class RigidPrim(XFormPrim):
         """
         return self._rigid_prim_view.get_angular_velocities(clone=clone)[0]
 
+    def set_velocities(self, linear_velocity, angular_velocity):
+        """
+        Sets both the linear and angular velocities of the prim in stage with a single physics-view write.
+
+        Args:
+            linear_velocity (th.tensor): linear velocity to set the rigid prim to. Shape (3,).
+            angular_velocity (th.tensor): angular velocity to set the rigid prim to. Shape (3,).
+        """
+        self._rigid_prim_view.set_velocities(th.cat([linear_velocity, angular_velocity])[None, :])
+
+    def get_velocities(self, clone=True):
+        """
+        Grabs both the linear and angular velocities of the prim in stage with a single physics-view read
+
+        Args:
+            clone (bool): Whether to clone the internal buffer or not when grabbing data
+
+        Returns:
+            2-tuple:
+                - th.tensor: current linear velocity of the rigid prim. Shape (3,).
+                - th.tensor: current angular velocity of the rigid prim. Shape (3,).
+        """
+        velocities = self._rigid_prim_view.get_velocities(clone=clone)[0]
+        return velocities[:3], velocities[3:]
+
     def set_position_orientation(self, position=None, orientation=None, frame: Literal["world", "scene"] = "world"):
         """
         Set the position and orientation of XForm Prim.
@@ -835,8 +860,7 @@ class RigidPrim(XFormPrim):
     def _dump_state(self):
         # Grab pose from super class
         state = super()._dump_state()
-        state["lin_vel"] = self.get_linear_velocity(clone=False)
-        state["ang_vel"] = self.get_angular_velocity(clone=False)
+        state["lin_vel"], state["ang_vel"] = self.get_velocities(clone=False)
 
         return state
 
@@ -850,11 +874,9 @@ class RigidPrim(XFormPrim):
         super()._load_state(state=state)
 
         # Set velocities if not kinematic
-        self.set_linear_velocity(
-            state["lin_vel"] if isinstance(state["lin_vel"], th.Tensor) else th.tensor(state["lin_vel"])
-        )
-        self.set_angular_velocity(
-            state["ang_vel"] if isinstance(state["ang_vel"], th.Tensor) else th.tensor(state["ang_vel"])
+        self.set_velocities(
+            state["lin_vel"] if isinstance(state["lin_vel"], th.Tensor) else th.tensor(state["lin_vel"]),
+            state["ang_vel"] if isinstance(state["ang_vel"], th.Tensor) else th.tensor(state["ang_vel"]),
         )
 
     def serialize(self, state):
@@ -2,7 +2,6 @@ import itertools
 import math
 import os
 from abc import ABC
-from collections import OrderedDict
 from typing import Iterable, List, Literal, Tuple
 
 import torch as th
@@ -115,7 +114,7 @@ class BehaviorRobot(ManipulationRobot, LocomotionRobot, ActiveCameraRobot):
         )
 
         # setup eef parts
-        self.parts = OrderedDict()
+        self.parts = dict()
         for arm_name in self.arm_names:
             self.parts[arm_name] = BRPart(
                 name=arm_name,
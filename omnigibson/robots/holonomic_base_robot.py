@@ -274,6 +274,16 @@ class HolonomicBaseRobot(LocomotionRobot):
         # Note that the link we are interested in is self.base_footprint_link, not self.root_link
         return self.base_footprint_link.get_angular_velocity()
 
+    def set_velocities(self, linear_velocity, angular_velocity):
+        # The fused default writes to the root link directly, but this robot's base velocities are realized through
+        # the virtual base joints, so route through the overridden per-component setters instead
+        self.set_linear_velocity(linear_velocity)
+        self.set_angular_velocity(angular_velocity)
+
+    def get_velocities(self):
+        # See comments of self.set_velocities
+        return self.get_linear_velocity(), self.get_angular_velocity()
+
     def _postprocess_control(self, control, control_type):
         # Run super method first
         u_vec, u_type_vec = super()._postprocess_control(control=control, control_type=control_type)
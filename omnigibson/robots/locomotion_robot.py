@@ -1,11 +1,13 @@
+import math
 from abc import abstractmethod
+from functools import cached_property
 
 import torch as th
 
 from omnigibson.controllers import LocomotionController
 from omnigibson.robots.robot_base import BaseRobot
 from omnigibson.utils.python_utils import classproperty
-from omnigibson.utils.transform_utils import euler2quat, quat2mat, quat_multiply
+from omnigibson.utils.transform_utils import quat_apply, quat_multiply
 from omnigibson.utils.usd_utils import ControllableObjectViewAPI
 
 
@@ -42,14 +44,32 @@ class LocomotionRobot(BaseRobot):
         joint_positions = ControllableObjectViewAPI.get_joint_positions(self.articulation_root_path)
         joint_velocities = ControllableObjectViewAPI.get_joint_velocities(self.articulation_root_path)
 
-        # Add base info
-        dic["base_qpos"] = joint_positions[self.base_control_idx]
-        dic["base_qpos_sin"] = th.sin(joint_positions[self.base_control_idx])
-        dic["base_qpos_cos"] = th.cos(joint_positions[self.base_control_idx])
-        dic["base_qvel"] = joint_velocities[self.base_control_idx]
+        # Add base info -- write into the reusable buffers rather than allocating four fresh tensors every
+        # step; this is safe because get_proprioception copies the values out when concatenating them into
+        # the final proprioception vector
+        bufs = self._base_proprio_bufs
+        th.index_select(joint_positions, 0, self.base_control_idx, out=bufs["qpos"])
+        th.sin(bufs["qpos"], out=bufs["sin"])
+        th.cos(bufs["qpos"], out=bufs["cos"])
+        th.index_select(joint_velocities, 0, self.base_control_idx, out=bufs["qvel"])
+        dic["base_qpos"] = bufs["qpos"]
+        dic["base_qpos_sin"] = bufs["sin"]
+        dic["base_qpos_cos"] = bufs["cos"]
+        dic["base_qvel"] = bufs["qvel"]
 
         return dic
 
+    @cached_property
+    def _base_proprio_bufs(self):
+        """
+        Returns:
+            dict: Preallocated destination buffers for the per-step base proprioception values, keyed by
+                {"qpos", "sin", "cos", "qvel"}. The number of base joints is fixed once the robot is loaded,
+                so these are allocated once and reused
+        """
+        n_base_joints = len(self.base_control_idx)
+        return {key: th.empty(n_base_joints) for key in ("qpos", "sin", "cos", "qvel")}
+
     @property
     def default_proprio_obs(self):
         obs_keys = super().default_proprio_obs
@@ -123,7 +143,8 @@ class LocomotionRobot(BaseRobot):
         Args:
             delta (float):float], (x,y,z) cartesian delta base position
         """
-        new_pos = th.tensor(delta) + self.get_position_orientation()[0]
+        delta = delta if isinstance(delta, th.Tensor) else th.tensor(delta, dtype=th.float32)
+        new_pos = delta + self.get_position_orientation()[0]
         self.set_position_orientation(position=new_pos)
 
     def move_forward(self, delta=0.05):
@@ -133,7 +154,7 @@ class LocomotionRobot(BaseRobot):
         Args:
             delta (float): delta base position forward
         """
-        self.move_by(quat2mat(self.get_position_orientation()[1]).dot(th.tensor([delta, 0, 0])))
+        self.move_by(quat_apply(self.get_position_orientation()[1], th.tensor([delta, 0.0, 0.0])))
 
     def move_backward(self, delta=0.05):
         """
@@ -142,7 +163,7 @@ class LocomotionRobot(BaseRobot):
         Args:
             delta (float): delta base position backward
         """
-        self.move_by(quat2mat(self.get_position_orientation()[1]).dot(th.tensor([-delta, 0, 0])))
+        self.move_by(quat_apply(self.get_position_orientation()[1], th.tensor([-delta, 0.0, 0.0])))
 
     def move_left(self, delta=0.05):
         """
@@ -151,7 +172,7 @@ class LocomotionRobot(BaseRobot):
         Args:
             delta (float): delta base position left
         """
-        self.move_by(quat2mat(self.get_position_orientation()[1]).dot(th.tensor([0, -delta, 0])))
+        self.move_by(quat_apply(self.get_position_orientation()[1], th.tensor([0.0, -delta, 0.0])))
 
     def move_right(self, delta=0.05):
         """
@@ -160,7 +181,7 @@ class LocomotionRobot(BaseRobot):
         Args:
             delta (float): delta base position right
         """
-        self.move_by(quat2mat(self.get_position_orientation()[1]).dot(th.tensor([0, delta, 0])))
+        self.move_by(quat_apply(self.get_position_orientation()[1], th.tensor([0.0, delta, 0.0])))
 
     def turn_left(self, delta=0.03):
         """
@@ -170,7 +191,7 @@ class LocomotionRobot(BaseRobot):
             delta (float): delta angle to rotate the base left
         """
         quat = self.get_position_orientation()[1]
-        quat = quat_multiply((euler2quat(-delta, 0, 0)), quat)
+        quat = quat_multiply(self._yaw_quat(delta), quat)
         self.set_position_orientation(orientation=quat)
 
     def turn_right(self, delta=0.03):
@@ -181,10 +202,49 @@ class LocomotionRobot(BaseRobot):
             delta (float): angle to rotate the base right
         """
         quat = self.get_position_orientation()[1]
-        quat = quat_multiply((euler2quat(delta, 0, 0)), quat)
+        quat = quat_multiply(self._yaw_quat(-delta), quat)
         self.set_position_orientation(orientation=quat)
 
-    @property
+    def move_and_turn(self, delta=(0.0, 0.0, 0.0), delta_yaw=0.0):
+        """
+        Move and rotate robot base in a single pose update without physics simulation. Equivalent to a
+        move_by of @delta expressed in the robot frame followed by a turn of @delta_yaw, but crosses the
+        pose read / write boundary only once instead of once per helper.
+
+        Args:
+            delta (3-array): (x,y,z) delta base position, in the robot frame
+            delta_yaw (float): delta angle to rotate the base about the z-axis (positive rotates left)
+        """
+        pos, quat = self.get_position_orientation()
+        delta = delta if isinstance(delta, th.Tensor) else th.tensor(delta, dtype=th.float32)
+        new_quat = quat_multiply(self._yaw_quat(delta_yaw), quat) if delta_yaw != 0.0 else quat
+        self.set_position_orientation(position=pos + quat_apply(quat, delta), orientation=new_quat)
+
+    @staticmethod
+    def _yaw_quat(angle):
+        """
+        Builds the quaternion for a rotation of @angle about the world z-axis directly, skipping the general
+        euler2quat pipeline since only a single axis is involved
+
+        Args:
+            angle (float): angle to rotate about the z-axis, in radians
+
+        Returns:
+            th.Tensor: (x,y,z,w) quaternion corresponding to the rotation
+        """
+        half = angle / 2.0
+        return th.tensor([0.0, 0.0, math.sin(half), math.cos(half)], dtype=th.float32)
+
+    def reload_controllers(self, controller_config=None):
+        # Run super first
+        super().reload_controllers(controller_config=controller_config)
+
+        # The cached base action indices depend on the controllers' command dims, which may have just changed,
+        # so clear the cached value and let it be lazily recomputed on next access
+        if "base_action_idx" in self.__dict__:
+            del self.base_action_idx
+
+    @cached_property
     def base_action_idx(self):
         controller_idx = self.controller_order.index("base")
         action_start_idx = sum([self.controllers[self.controller_order[i]].command_dim for i in range(controller_idx)])
@@ -202,13 +262,16 @@ class LocomotionRobot(BaseRobot):
         """
         raise NotImplementedError
 
-    @property
+    @cached_property
     def base_control_idx(self):
         """
         Returns:
-            n-array: Indices in low-level control vector corresponding to base joints.
+            n-array: Indices in low-level control vector corresponding to base joints. The joint ordering is
+                fixed once the robot is loaded, so this is computed once and cached, and stored as int64 --
+                the dtype torch indexing and index_select consume directly without conversion.
         """
-        return th.tensor([list(self.joints.keys()).index(name) for name in self.base_joint_names])
+        joint_idx_by_name = {name: i for i, name in enumerate(self.joints.keys())}
+        return th.tensor([joint_idx_by_name[name] for name in self.base_joint_names], dtype=th.long)
 
     @classproperty
     def _do_not_register_classes(cls):
@@ -347,6 +347,9 @@ class VisionSensor(BaseSensor):
         Returns:
             dict: Preprocessed dictionary of semantic IDs to class labels
         """
+        # Hoist the class-name-to-id mapping out of the loop -- the membership check below is an O(1) key lookup
+        # on this dict rather than a linear scan over semantic_class_id_to_name().values() per label
+        class_name_to_id = semantic_class_name_to_id()
         replicator_mapping = {}
         for key, val in id_to_labels.items():
             key = int(key)
@@ -361,7 +364,7 @@ class VisionSensor(BaseSensor):
                 replicator_mapping[key] = categories[0]
 
             assert (
-                replicator_mapping[key] in semantic_class_id_to_name().values()
+                replicator_mapping[key] in class_name_to_id
             ), f"Class {val['class']} does not exist in the semantic class name to id mapping!"
         return replicator_mapping
 
@@ -530,11 +533,12 @@ class VisionSensor(BaseSensor):
             dict: Remapped id_to_labels dictionary
         """
         replicator_mapping = self._preprocess_semantic_labels(id_to_labels)
+        class_name_to_id = semantic_class_name_to_id()
         for bbox in bboxes:
-            bbox["semanticId"] = semantic_class_name_to_id()[replicator_mapping[bbox["semanticId"]]]
+            bbox["semanticId"] = class_name_to_id[replicator_mapping[bbox["semanticId"]]]
         # Replicator returns each box as a numpy.void; we convert them to tuples here
         bboxes = [box.tolist() for box in bboxes]
-        info = {semantic_class_name_to_id()[val]: val for val in replicator_mapping.values()}
+        info = {class_name_to_id[val]: val for val in replicator_mapping.values()}
         return bboxes, info
 
     def add_modality(self, modality):
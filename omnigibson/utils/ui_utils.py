@@ -24,6 +24,16 @@ import omnigibson.utils.transform_utils as T
 from omnigibson.macros import gm
 
 
+def supports_color():
+    """
+    Returns:
+        bool: Whether stdout is an interactive terminal that can render ANSI colors. When it is not (e.g.: logs
+            piped to a file), we skip termcolor entirely to avoid both the escape-code garbage and the overhead
+    """
+    stdout = sys.stdout
+    return stdout is not None and hasattr(stdout, "isatty") and stdout.isatty()
+
+
 def print_icon():
     raw_texts = [
         # Lgrey, grey, lgrey, grey, red, lgrey, red
@@ -37,14 +47,16 @@ def print_icon():
         ("                 ", "\\  \\", "/", "___\\  ", "", "", "\\   /"),
         ("                  ", "\\__________", "", "", "", "", "\\_/  "),
     ]
+    use_color = supports_color()
     for lgrey_text0, grey_text0, lgrey_text1, grey_text1, red_text0, lgrey_text2, red_text1 in raw_texts:
-        lgrey_text0 = colored(lgrey_text0, "light_grey", attrs=["bold"])
-        grey_text0 = colored(grey_text0, "light_grey", attrs=["bold", "dark"])
-        lgrey_text1 = colored(lgrey_text1, "light_grey", attrs=["bold"])
-        grey_text1 = colored(grey_text1, "light_grey", attrs=["bold", "dark"])
-        red_text0 = colored(red_text0, "light_red", attrs=["bold"])
-        lgrey_text2 = colored(lgrey_text2, "light_grey", attrs=["bold"])
-        red_text1 = colored(red_text1, "light_red", attrs=["bold"])
+        if use_color:
+            lgrey_text0 = colored(lgrey_text0, "light_grey", attrs=["bold"])
+            grey_text0 = colored(grey_text0, "light_grey", attrs=["bold", "dark"])
+            lgrey_text1 = colored(lgrey_text1, "light_grey", attrs=["bold"])
+            grey_text1 = colored(grey_text1, "light_grey", attrs=["bold", "dark"])
+            red_text0 = colored(red_text0, "light_red", attrs=["bold"])
+            lgrey_text2 = colored(lgrey_text2, "light_grey", attrs=["bold"])
+            red_text1 = colored(red_text1, "light_red", attrs=["bold"])
         print(lgrey_text0 + grey_text0 + lgrey_text1 + grey_text1 + red_text0 + lgrey_text2 + red_text1)
 
 
@@ -56,13 +68,17 @@ def print_logo():
         ("     | |_| | | | | | | | | | |", " |_| | | |_) \__ \ (_) | | | |"),
         ("      \___/|_| |_| |_|_| |_|_|", "\____|_|_.__/|___/\___/|_| |_|"),
     ]
+    use_color = supports_color()
     for grey_text, red_text in raw_texts:
-        grey_text = colored(grey_text, "light_grey", attrs=["bold", "dark"])
-        red_text = colored(red_text, "light_red", attrs=["bold"])
+        if use_color:
+            grey_text = colored(grey_text, "light_grey", attrs=["bold", "dark"])
+            red_text = colored(red_text, "light_red", attrs=["bold"])
         print(grey_text + red_text)
 
 
 def logo_small():
+    if not supports_color():
+        return "OmniGibson"
     grey_text = colored("Omni", "light_grey", attrs=["bold", "dark"])
     red_text = colored("Gibson", "light_red", attrs=["bold"])
     return grey_text + red_text
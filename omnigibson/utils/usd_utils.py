@@ -725,6 +725,11 @@ class PoseAPI:
 
     VALID = False
 
+    # Monotonically increasing counter bumped on every invalidation. Unlike VALID -- which any pose read
+    # flips back to True via _refresh -- this lets consumers detect whether any pose write happened since
+    # they last computed a pose-derived value, e.g. for caching purposes
+    WRITE_GENERATION = 0
+
     # Dictionary mapping prim path to fabric prim
     PRIMS = dict()
 
@@ -735,6 +740,7 @@ class PoseAPI:
     @classmethod
     def invalidate(cls):
         cls.VALID = False
+        cls.WRITE_GENERATION += 1
 
     @classmethod
     def mark_valid(cls):